@@ -1,8 +1,17 @@
 import os
+import html
+import time
+import asyncio
+import threading
+from collections import OrderedDict
 import streamlit as st
 import pickle
-import pandas as pd
+import numpy as np
 import requests
+import aiohttp
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # -------------- ENV SETUP --------------
@@ -11,94 +20,329 @@ TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 if not TMDB_API_KEY:
     raise ValueError("TMDB_API_KEY not set. Please set it in the .env file.")
 
+# -------------- HTTP SESSION --------------
+# (connect, read) timeout for every TMDB call, so a network stall can't hang the app
+TIMEOUT = (3, 7)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+# Longest wait we'll honour from a Retry-After header, so a large value can't stall the script thread
+RETRY_AFTER_CAP = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class CappedRetry(Retry):
+    """
+    urllib3 Retry whose Retry-After wait is capped at RETRY_AFTER_CAP seconds.
+    """
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_CAP)
+
+# Shared session so TMDB calls reuse keep-alive connections instead of
+# paying a new TCP+TLS handshake per request. Rate-limited (429) and transient
+# server errors are retried with backoff, honouring TMDB's Retry-After header
+# up to RETRY_AFTER_CAP; once retries run out the last response is returned
+# for the usual status check.
+retry = CappedRetry(
+    total=MAX_RETRIES,
+    backoff_factor=BACKOFF_FACTOR,
+    status_forcelist=RETRY_STATUSES,
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=20, pool_connections=20))
+SESSION.headers.update({'User-Agent': 'MovieRecommender/1.0'})
+
 # -------------- FETCH DATA FROM TMDB --------------
-def fetch_movie_details(movie_id):
+POSTER_BASE = 'https://image.tmdb.org/t/p/w342'
+MOVIE_DETAILS_TTL = 86400
+MOVIE_DETAILS_MAX_ENTRIES = 2048
+PLACEHOLDER = 'https://via.placeholder.com/500x750.png?text=No+Image'
+
+def items_to_cards(items):
     """
-    Fetch detailed info about a movie from TMDB.
-    Returns a dict including poster, overview, release date, rating, etc.
+    Map TMDB movie results (trending, top rated, search, details) to movie dicts for the grid.
     """
-    url = f"https://api.themoviedb.org/3/movie/{movie_id}?api_key={TMDB_API_KEY}&language=en-US"
-    response = requests.get(url)
-    if response.status_code != 200:
-        return {
-            'id': movie_id,
-            'title': 'N/A',
-            'poster': 'https://via.placeholder.com/500x750.png?text=No+Image',
-            'overview': 'No overview available',
-            'release_date': 'N/A',
-            'rating': 'N/A'
+    return [
+        {
+            'id': item.get('id'),
+            'title': item.get('title', 'N/A'),
+            'poster': POSTER_BASE + item['poster_path'] if item.get('poster_path') else PLACEHOLDER,
+            'overview': item.get('overview', 'No overview available'),
+            'release_date': item.get('release_date', 'N/A'),
+            'rating': item.get('vote_average', 'N/A')
         }
+        for item in items
+    ]
+
+def parse_movie_details(movie_id, data):
+    """
+    Turn a TMDB movie payload (with appended credits and videos) into a movie dict:
+    the items_to_cards fields plus cast, director and trailer.
+    Returns placeholder details when data is None.
+    """
+    if data is None:
+        return dict(items_to_cards([{'id': movie_id}])[0], cast=[], director='N/A', trailer=None)
+
+    card = items_to_cards([data])[0]
+    if card['id'] is None:
+        card['id'] = movie_id
+
+    credits = data.get('credits', {})
+    # TMDB can return members without a name; skip them so rendering never sees None
+    cast = [member['name'] for member in credits.get('cast', []) if member.get('name')][:5]
+    director = next((member['name'] for member in credits.get('crew', [])
+                     if member.get('job') == 'Director' and member.get('name')), 'N/A')
+    trailer_key = next((video.get('key') for video in data.get('videos', {}).get('results', [])
+                        if video.get('site') == 'YouTube' and video.get('type') == 'Trailer'), None)
+    trailer_url = f"https://www.youtube.com/watch?v={trailer_key}" if trailer_key else None
+
+    return dict(card, cast=cast, director=director, trailer=trailer_url)
+
+async def fetch_movie_details_async(session, movie_id):
+    """
+    Fetch detailed info about a movie from TMDB using a shared aiohttp session.
+    Returns a dict including poster, overview, release date, rating, cast, director and trailer,
+    or None if TMDB could not provide it. Credits and videos are appended to the same request
+    to avoid follow-up calls.
+    """
+    url = f"https://api.themoviedb.org/3/movie/{movie_id}"
+    params = {'api_key': TMDB_API_KEY, 'append_to_response': 'credits,videos', 'language': 'en-US'}
+    # Mirrors the SESSION retry policy: back off on 429/5xx and on connect/read
+    # errors, preferring a capped Retry-After; None once retries run out
+    for attempt in range(MAX_RETRIES + 1):
+        retry_after = ''
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return parse_movie_details(movie_id, orjson.loads(await response.read()))
+                if response.status not in RETRY_STATUSES:
+                    return None
+                retry_after = response.headers.get('Retry-After', '')
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        if attempt < MAX_RETRIES:
+            delay = min(float(retry_after), RETRY_AFTER_CAP) if retry_after.isdigit() else BACKOFF_FACTOR * 2 ** attempt
+            await asyncio.sleep(delay)
+    return None
+
+async def fetch_many_movie_details(movie_ids):
+    """
+    Fetch details for several movies concurrently over one aiohttp session.
+    """
+    async with aiohttp.ClientSession(
+        headers={'User-Agent': 'MovieRecommender/1.0'},
+        timeout=aiohttp.ClientTimeout(sock_connect=TIMEOUT[0], sock_read=TIMEOUT[1])
+    ) as session:
+        return await asyncio.gather(*(fetch_movie_details_async(session, movie_id) for movie_id in movie_ids))
 
-    data = response.json()
-    poster_path = data.get('poster_path')
-    poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}" if poster_path else 'https://via.placeholder.com/500x750.png?text=No+Image'
+@st.cache_resource
+def movie_details_store():
+    """
+    Per-movie TMDB details shared across sessions and reruns, as {movie_id: (fetched_at, details)},
+    with the lock that guards it. Ordered oldest fetch first so the store can be trimmed from the front.
+    """
+    return OrderedDict(), threading.Lock()
+
+def get_movie_details(movie_ids):
+    """
+    Return TMDB details for each movie id, in order, or None where TMDB could not provide them.
+    Only ids missing from the store (or older than a day) are fetched, concurrently.
+    """
+    store, lock = movie_details_store()
+    now = time.time()
+    # Snapshot entries under the lock; the fetch itself runs without holding it
+    with lock:
+        entries = {movie_id: store.get(movie_id) for movie_id in movie_ids}
+    missing = [movie_id for movie_id, entry in entries.items()
+               if entry is None or now - entry[0] > MOVIE_DETAILS_TTL]
+    if missing:
+        fetched = asyncio.run(fetch_many_movie_details(missing))
+        with lock:
+            for movie_id, details in zip(missing, fetched):
+                # Failed fetches aren't stored; a stale entry beats a placeholder
+                if details is not None:
+                    entries[movie_id] = store[movie_id] = (now, details)
+                    store.move_to_end(movie_id)
+            while len(store) > MOVIE_DETAILS_MAX_ENTRIES:
+                store.popitem(last=False)
+    return [entries[movie_id][1] if entries[movie_id] is not None else None for movie_id in movie_ids]
+
+def cache_window(seconds):
+    """
+    Return the index of the current time window of the given length.
+    Disk-persisted caches ignore ttl, so passing this as an argument rotates the cache key instead.
+    """
+    return int(time.time() // seconds)
+
+@st.cache_resource
+def last_cache_windows():
+    """
+    Last cache window used per disk-cached function name, shared across sessions.
+    """
+    return {}
+
+def current_window(cached_func, seconds):
+    """
+    Return cache_window(seconds) for cached_func, clearing its persisted entries whenever the
+    window rolls over so old windows don't pile up on disk. Entries left from before a server
+    restart are removed at the next rollover.
+    """
+    window = cache_window(seconds)
+    windows = last_cache_windows()
+    if windows.get(cached_func.__name__, window) != window:
+        cached_func.clear()
+    windows[cached_func.__name__] = window
+    return window
+
+class TMDBUnavailable(Exception):
+    """
+    Raised inside disk-cached functions when TMDB fails, so the degraded result it carries
+    is shown without being cached.
+    """
+    def __init__(self, fallback):
+        super().__init__("TMDB request failed")
+        self.fallback = fallback
 
-    return {
-        'id': data.get('id', movie_id),
-        'title': data.get('title', 'N/A'),
-        'poster': poster_url,
-        'overview': data.get('overview', 'No overview available'),
-        'release_date': data.get('release_date', 'N/A'),
-        'rating': data.get('vote_average', 'N/A')
-    }
+@st.cache_data(persist="disk", max_entries=2, show_spinner=False)
+def fetch_trending_results(window):
+    """
+    Fetch a list of trending movies (weekly) from TMDB, cached on disk per window.
+    Raises TMDBUnavailable on failure so the empty list isn't cached.
+    """
+    url = "https://api.themoviedb.org/3/trending/movie/week"
+    params = {'api_key': TMDB_API_KEY}
+    try:
+        response = SESSION.get(url, params=params, timeout=TIMEOUT)
+    except requests.RequestException as exc:
+        raise TMDBUnavailable([]) from exc
+    if response.status_code != 200:
+        raise TMDBUnavailable([])
+    data = orjson.loads(response.content)
+    return data.get('results', [])
 
 def fetch_trending_movies():
     """
-    Fetch a list of trending movies (weekly) from TMDB.
+    Fetch a list of trending movies (weekly) from TMDB, or [] if TMDB is unavailable.
+    Cached on disk per hour so restarts don't refetch.
+    """
+    try:
+        return fetch_trending_results(current_window(fetch_trending_results, 3600))
+    except TMDBUnavailable as exc:
+        return exc.fallback
+
+@st.cache_data(persist="disk", max_entries=2, show_spinner=False)
+def fetch_top_rated_results(window):
     """
-    url = f"https://api.themoviedb.org/3/trending/movie/week?api_key={TMDB_API_KEY}"
-    response = requests.get(url)
+    Fetch a list of top-rated movies from TMDB, cached on disk per window.
+    Raises TMDBUnavailable on failure so the empty list isn't cached.
+    """
+    url = "https://api.themoviedb.org/3/movie/top_rated"
+    params = {'api_key': TMDB_API_KEY, 'language': 'en-US', 'page': 1}
+    try:
+        response = SESSION.get(url, params=params, timeout=TIMEOUT)
+    except requests.RequestException as exc:
+        raise TMDBUnavailable([]) from exc
     if response.status_code != 200:
-        return []
-    data = response.json()
+        raise TMDBUnavailable([])
+    data = orjson.loads(response.content)
     return data.get('results', [])
 
 def fetch_top_rated_movies():
     """
-    Fetch a list of top-rated movies from TMDB.
+    Fetch a list of top-rated movies from TMDB, or [] if TMDB is unavailable.
+    Cached on disk per 6 hours so restarts don't refetch.
     """
-    url = f"https://api.themoviedb.org/3/movie/top_rated?api_key={TMDB_API_KEY}&language=en-US&page=1"
-    response = requests.get(url)
+    try:
+        return fetch_top_rated_results(current_window(fetch_top_rated_results, 21600))
+    except TMDBUnavailable as exc:
+        return exc.fallback
+
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def search_results(query):
+    """
+    Search for movies by title using TMDB, cached per query.
+    Raises TMDBUnavailable on failure so the empty list isn't cached.
+    """
+    url = "https://api.themoviedb.org/3/search/movie"
+    # Passed as params so requests URL-encodes spaces and special characters
+    params = {'api_key': TMDB_API_KEY, 'language': 'en-US', 'query': query}
+    try:
+        response = SESSION.get(url, params=params, timeout=TIMEOUT)
+    except requests.RequestException as exc:
+        raise TMDBUnavailable([]) from exc
     if response.status_code != 200:
-        return []
-    data = response.json()
+        raise TMDBUnavailable([])
+    data = orjson.loads(response.content)
     return data.get('results', [])
 
 def search_movies(query):
     """
-    Search for movies by title using TMDB.
+    Search for movies by title using TMDB, or [] if TMDB is unavailable.
     """
-    url = f"https://api.themoviedb.org/3/search/movie?api_key={TMDB_API_KEY}&language=en-US&query={query}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        return []
-    data = response.json()
-    return data.get('results', [])
+    try:
+        return search_results(query)
+    except TMDBUnavailable as exc:
+        return exc.fallback
 
 # -------------- RECOMMENDATION LOGIC --------------
-def recommend(movie_title):
+@st.cache_data(persist="disk", max_entries=5000, show_spinner=False)
+def recommend_for_window(movie_title, window):
     """
-    Given a movie title (from local 'movies'), return 5 recommended movies (with TMDB details).
+    Given a movie title (from the local dataset), return 5 recommended movies (with TMDB details),
+    cached on disk per title and window. Raises TMDBUnavailable carrying the result when any
+    movie's details are placeholders, so a TMDB outage isn't cached.
     """
-    if movie_title not in movies['title'].values:
+    movie_index = TITLE_TO_IDX.get(movie_title)
+    if movie_index is None:
         return []
 
-    movie_index = movies[movies['title'] == movie_title].index[0]
-    distances = similarity[movie_index]
-    movies_list = sorted(enumerate(distances), key=lambda x: x[1], reverse=True)[1:6]
-
-    recommended = []
-    for i in movies_list:
-        movie_id = movies.iloc[i[0]].movie_id
-        details = fetch_movie_details(movie_id)
-        recommended.append(details)
+    # Neighbours are precomputed offline (see notebook), sorted by similarity
+    top = NEIGHBOR_IDX[movie_index]
+    top = top[top != movie_index][:5]
 
+    # TMDB details come from the shared store; misses are fetched concurrently (at most 5)
+    ids = [int(MOVIE_IDS[i]) for i in top]
+    details = get_movie_details(ids)
+    recommended = [d if d is not None else parse_movie_details(movie_id, None) for movie_id, d in zip(ids, details)]
+    if None in details:
+        raise TMDBUnavailable(recommended)
     return recommended
 
+def recommend(movie_title):
+    """
+    Given a movie title (from the local dataset), return 5 recommended movies (with TMDB details).
+    Cached on disk for a day, so repeat clicks skip the TMDB fan-out; the previous day's entries
+    are cleared at rollover, so the disk cache holds at most one file per title.
+    """
+    try:
+        return recommend_for_window(movie_title, current_window(recommend_for_window, 86400))
+    except TMDBUnavailable as exc:
+        return exc.fallback
+
 # -------------- LOAD LOCAL DATA --------------
-movies_dict = pickle.load(open('movie_dict.pkl', 'rb'))
-movies = pd.DataFrame(movies_dict)
-similarity = pickle.load(open('similarity.pkl', 'rb'))
+@st.cache_resource
+def load_artifacts():
+    """
+    Load the processed movie data and precomputed neighbour indices once per server process.
+    Only the title and movie_id columns are used, so they are kept as plain arrays.
+    """
+    with open('movie_dict.pkl', 'rb') as f:
+        movies_dict = pickle.load(f)
+    # movie_dict.pkl is DataFrame.to_dict() output ({column: {index: value}}), in row order
+    titles = np.array(list(movies_dict['title'].values()), dtype=object)
+    movie_ids = np.fromiter(movies_dict['movie_id'].values(), dtype=np.int32)
+    # Compact N x 51 int16 table (each movie plus its 50 nearest neighbours), a few hundred KB
+    with np.load('neighbors.npz') as neighbors:
+        neighbor_idx = neighbors['idx']
+    # Positional title lookup so recommend() avoids a scan per call.
+    # Duplicate titles keep their first occurrence, as the old boolean mask did.
+    title_to_idx = {}
+    for i, t in enumerate(titles):
+        title_to_idx.setdefault(t, i)
+    return titles, movie_ids, neighbor_idx, title_to_idx
+
+TITLES, MOVIE_IDS, NEIGHBOR_IDX, TITLE_TO_IDX = load_artifacts()
 
 # -------------- STREAMLIT PAGE CONFIG --------------
 st.set_page_config(
@@ -108,7 +352,7 @@ st.set_page_config(
 )
 
 # -------------- CUSTOM CSS FOR STYLING --------------
-st.markdown("""
+CSS_BLOB = """
 <style>
 /* Container adjustments */
 .main .block-container {
@@ -137,6 +381,7 @@ footer {visibility: hidden;}
 .movie-poster {
     border-radius: 10px;
     width: 180px;
+    max-width: 100%;
     height: auto;
     transition: transform 0.2s ease-in-out;
     cursor: pointer;
@@ -165,10 +410,29 @@ footer {visibility: hidden;}
     margin-top: 5px;
 }
 
-/* Custom styling for the expander content to enforce consistent padding/height */
-[data-testid="stExpander"] > div:nth-child(2) {
-    min-height: 100px;
-    padding: 10px;
+/* Grid row holding the movie cards: up to --cols per line, wrapping on narrow screens */
+.movie-row {
+    display: grid;
+    gap: 1rem;
+    align-items: start;
+    grid-template-columns: repeat(auto-fill, minmax(max(180px, calc((100% - (var(--cols) - 1) * 1rem) / var(--cols))), 1fr));
+}
+
+/* Collapsible overview with consistent padding */
+.movie-details {
+    margin-top: 10px;
+    text-align: left;
+    font-size: 0.9rem;
+    color: #ccc;
+}
+.movie-details summary {
+    cursor: pointer;
+    text-align: center;
+    color: #fff;
+}
+.movie-details p {
+    padding: 5px 10px 0;
+    margin: 0;
 }
 
 /* Custom button styling */
@@ -185,61 +449,75 @@ div.stButton > button:hover {
     background-color: #5750c5;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Re-emitted on every run: Streamlit drops elements a rerun doesn't produce,
+# so injecting this only once per session would lose the styling.
+st.markdown(CSS_BLOB, unsafe_allow_html=True)
 
 # -------------- HELPER: DISPLAY MOVIES IN A GRID --------------
+def html_text(value):
+    """
+    Escape a value for the card HTML, collapsing whitespace first: a blank line would end
+    the HTML block in st.markdown and spill the rest of the row out as Markdown.
+    """
+    return html.escape(' '.join(str(value).split()))
+
+def movie_card_html(movie_data):
+    """
+    Build the HTML for one movie card: clickable poster and title, info lines and a
+    collapsible overview.
+    """
+    tmdb_id = movie_data.get('id', '')
+    tmdb_link = html_text(f"https://www.themoviedb.org/movie/{tmdb_id}")
+    title = html_text(movie_data.get('title', 'N/A'))
+    poster = html_text(movie_data['poster'])
+
+    parts = [
+        '<div class="movie-container">',
+        # Clickable poster
+        f'<a href="{tmdb_link}" target="_blank"><img src="{poster}" class="movie-poster" loading="lazy" width="180" height="270" decoding="async"/></a>',
+        # Clickable title
+        f'<a href="{tmdb_link}" target="_blank" style="text-decoration: none; color: #fff;">'
+        f'<div class="movie-title">{title}</div></a>',
+    ]
+    # Release date and rating
+    release_date = movie_data.get('release_date', 'N/A')
+    if release_date != 'N/A':
+        parts.append(f"<div class='movie-info'>Release: {html_text(release_date)}</div>")
+    rating = movie_data.get('rating', 'N/A')
+    if rating != 'N/A':
+        parts.append(f"<div class='movie-info'>Rating: {html_text(rating)}</div>")
+
+    # Collapsible overview; a <details> tag keeps the card free of Streamlit widgets
+    overview_text = html_text(movie_data.get('overview', 'No overview available'))
+    parts.append(f'<details class="movie-details"><summary>Show More</summary><p>{overview_text}</p>')
+    # Extra details are only present for movies fetched via get_movie_details
+    director = movie_data.get('director', 'N/A')
+    if director != 'N/A':
+        parts.append(f'<p>Director: {html_text(director)}</p>')
+    if movie_data.get('cast'):
+        parts.append(f"<p>Cast: {html_text(', '.join(movie_data['cast']))}</p>")
+    if movie_data.get('trailer'):
+        parts.append(f'<p><a href="{html_text(movie_data["trailer"])}" target="_blank">Watch trailer</a></p>')
+    parts.append('</details></div>')
+    return ''.join(parts)
+
 def display_movies_in_grid(movie_list, cols=5):
     """
     Display movie dictionaries in a grid with clickable posters and titles.
+    Each row is emitted as a single HTML block to keep Streamlit messages to one per row.
     """
     if not movie_list:
         st.warning("No movies to display.")
         return
 
     for i in range(0, len(movie_list), cols):
-        row = st.columns(cols)
-        for col, movie_data in zip(row, movie_list[i:i+cols]):
-            tmdb_id = movie_data.get('id', '')
-            tmdb_link = f"https://www.themoviedb.org/movie/{tmdb_id}"
-
-            with col:
-                st.markdown('<div class="movie-container">', unsafe_allow_html=True)
-                # Clickable poster
-                st.markdown(
-                    f"""
-                    <a href="{tmdb_link}" target="_blank">
-                        <img src="{movie_data['poster']}" class="movie-poster"/>
-                    </a>
-                    """,
-                    unsafe_allow_html=True
-                )
-                # Clickable title
-                st.markdown(
-                    f"""
-                    <a href="{tmdb_link}" target="_blank" style="text-decoration: none; color: #fff;">
-                        <div class="movie-title">{movie_data['title']}</div>
-                    </a>
-                    """,
-                    unsafe_allow_html=True
-                )
-                # Release date and rating
-                release_date = movie_data.get('release_date', 'N/A')
-                if release_date != 'N/A':
-                    st.markdown(
-                        f"<div class='movie-info'>Release: {release_date}</div>",
-                        unsafe_allow_html=True
-                    )
-                rating = movie_data.get('rating', 'N/A')
-                if rating != 'N/A':
-                    st.markdown(
-                        f"<div class='movie-info'>Rating: {rating}</div>",
-                        unsafe_allow_html=True
-                    )
-                # Expander for the movie overview with consistent padding
-                with st.expander("Show More"):
-                    overview_text = movie_data.get('overview', 'No overview available')
-                    st.write(overview_text)
-                st.markdown('</div>', unsafe_allow_html=True)
+        cards = ''.join(movie_card_html(movie_data) for movie_data in movie_list[i:i+cols])
+        st.markdown(
+            f'<div class="movie-row" style="--cols: {cols};">{cards}</div>',
+            unsafe_allow_html=True
+        )
 
 # -------------- MAIN APP INTERFACE --------------
 st.title("🎬 Movie Recommender System")
@@ -251,7 +529,7 @@ with tabs[0]:
     st.subheader("Get Movie Recommendations")
     selected_movie_name = st.selectbox(
         "Select a movie from our dataset:",
-        movies['title'].values
+        TITLES
     )
     if st.button('Recommend'):
         recommended = recommend(selected_movie_name)
@@ -267,19 +545,7 @@ with tabs[1]:
     if st.button("Search"):
         results = search_movies(query)
         if results:
-            movie_list = []
-            for item in results:
-                poster_path = item.get('poster_path')
-                poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}" if poster_path else 'https://via.placeholder.com/500x750.png?text=No+Image'
-                movie_list.append({
-                    'id': item.get('id'),
-                    'title': item.get('title', 'N/A'),
-                    'poster': poster_url,
-                    'overview': item.get('overview', 'No overview available'),
-                    'release_date': item.get('release_date', 'N/A'),
-                    'rating': item.get('vote_average', 'N/A')
-                })
-            display_movies_in_grid(movie_list, cols=5)
+            display_movies_in_grid(items_to_cards(results), cols=5)
         else:
             st.warning("No results found. Try a different query.")
 
@@ -288,19 +554,7 @@ with tabs[2]:
     st.subheader("Trending Movies (This Week)")
     trending_data = fetch_trending_movies()
     if trending_data:
-        trending_list = []
-        for item in trending_data:
-            poster_path = item.get('poster_path')
-            poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}" if poster_path else 'https://via.placeholder.com/500x750.png?text=No+Image'
-            trending_list.append({
-                'id': item.get('id'),
-                'title': item.get('title', 'N/A'),
-                'poster': poster_url,
-                'overview': item.get('overview', 'No overview available'),
-                'release_date': item.get('release_date', 'N/A'),
-                'rating': item.get('vote_average', 'N/A')
-            })
-        display_movies_in_grid(trending_list, cols=5)
+        display_movies_in_grid(items_to_cards(trending_data), cols=5)
     else:
         st.warning("Could not fetch trending movies at the moment.")
 
@@ -309,18 +563,6 @@ with tabs[3]:
     st.subheader("Top Rated Movies")
     top_rated_data = fetch_top_rated_movies()
     if top_rated_data:
-        top_rated_list = []
-        for item in top_rated_data:
-            poster_path = item.get('poster_path')
-            poster_url = f"https://image.tmdb.org/t/p/w500/{poster_path}" if poster_path else 'https://via.placeholder.com/500x750.png?text=No+Image'
-            top_rated_list.append({
-                'id': item.get('id'),
-                'title': item.get('title', 'N/A'),
-                'poster': poster_url,
-                'overview': item.get('overview', 'No overview available'),
-                'release_date': item.get('release_date', 'N/A'),
-                'rating': item.get('vote_average', 'N/A')
-            })
-        display_movies_in_grid(top_rated_list, cols=5)
+        display_movies_in_grid(items_to_cards(top_rated_data), cols=5)
     else:
         st.warning("Could not fetch top rated movies at the moment.")